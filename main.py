@@ -1,6 +1,14 @@
-from concurrent.futures import ThreadPoolExecutor
-from queue import Queue, Empty
-from threading import Lock
+import functools
+import logging
+import socket
+import threading
+import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from itertools import batched, chain
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue, SimpleQueue
 
 import click
 import oci
@@ -8,238 +16,838 @@ from oci import Response
 from oci.log_analytics import LogAnalyticsClient
 from oci.log_analytics.models import LogAnalyticsEntitySummary
 from oci.object_storage import ObjectStorageClient
-from oci.object_storage.models import ObjectVersionSummary, MultipartUploadPartSummary
-from tenacity import retry, stop_after_attempt, wait_fixed
+from oci.object_storage.models import (
+    ObjectVersionSummary,
+    MultipartUpload,
+    PreauthenticatedRequestSummary,
+    ObjectLifecycleRule,
+    PutObjectLifecyclePolicyDetails,
+    BatchDeleteObjectIdentifier,
+    BatchDeleteObjectsDetails,
+)
+
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_random_exponential,
+)
 from tqdm import tqdm
 
+logger = logging.getLogger(__name__)
 
-def list_object_versions(
-        object_storage_client: ObjectStorageClient, bucket_name: str, namespace: str
-) -> list[ObjectVersionSummary]:
-    """List all object versions in a bucket with pagination"""
+
+class TqdmLoggingHandler(logging.StreamHandler):
+    """Write log records above any active progress bars"""
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            tqdm.write(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+def configure_logging(verbose: bool = False) -> QueueListener:
+    """Route log records through a queue so worker threads never wait on terminal output"""
+    # Unbounded and never joined, so the lighter SimpleQueue is enough
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+    # Per-resource detail is only formatted when asked for
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+    listener = QueueListener(log_queue, TqdmLoggingHandler())
+    listener.start()
+    return listener
+
+
+PROGRESS_BAR_FORMAT = (
+    "{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] {postfix}"
+)
+
+# Deletes are network-bound single requests, so run many at once by default
+DEFAULT_WORKERS = 32
+
+# Items requested per list call; 1000 is the service maximum for every listing used here
+LIST_PAGE_SIZE = 1000
+
+# Upper bound on queued-but-unfinished tasks per worker thread
+MAX_PENDING_PER_WORKER = 4
+
+# Object names per BatchDeleteObjects request with --bulk-delete
+BULK_DELETE_BATCH_SIZE = 1000
+
+# Times a bucket is emptied again when its delete finds new contents
+BUCKET_NOT_EMPTY_RETRIES = 2
+
+# Objects, preauthenticated requests and multipart uploads are cleaned side by side
+BUCKET_PHASES = 3
+
+# Keep-alive connection pool sizing for the shared HTTPS session; the pool
+# grows past POOL_MAXSIZE when the requested concurrency needs more sockets
+POOL_CONNECTIONS = 64
+POOL_MAXSIZE = 256
+
+# urllib3's default TCP_NODELAY plus TCP keepalive probes, so idle pooled sockets
+# that a NAT or load balancer silently dropped are detected instead of hanging a worker
+KEEPALIVE_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    *(
+        (socket.IPPROTO_TCP, getattr(socket, name), value)
+        for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+        if hasattr(socket, name)
+    ),
+]
+
+# (connect, read) timeouts so a stalled socket can't pin a worker indefinitely
+CLIENT_TIMEOUT = (10, 120)
+
+# Number of buckets from a bucket file cleaned at the same time
+BUCKET_CONCURRENCY = 8
+
+
+@functools.cache
+def keepalive_adapter(adapter_cls: type) -> type:
+    """Subclass a transport adapter so its pooled sockets use KEEPALIVE_SOCKET_OPTIONS"""
+
+    class KeepAliveAdapter(adapter_cls):
+        def init_poolmanager(self, *args, **pool_kwargs):
+            pool_kwargs.setdefault("socket_options", KEEPALIVE_SOCKET_OPTIONS)
+            super().init_poolmanager(*args, **pool_kwargs)
+
+    return KeepAliveAdapter
+
+
+def configure_connection_pool(
+        client, pool_connections: int, pool_maxsize: int, pool_block: bool = False
+):
+    """Remount the client's HTTPS adapter with a larger keep-alive connection pool"""
+    session = client.base_client.session
+    # Extend the SDK's own adapter class so OCI-specific transport behavior is kept;
+    # every worker thread shares this one session and its pool
+    adapter_cls = type(session.get_adapter("https://"))
+    adapter = keepalive_adapter(adapter_cls)(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    logger.debug(
+        "Mounted %s with pool_connections=%d pool_maxsize=%d pool_block=%s",
+        adapter_cls.__name__,
+        pool_connections,
+        pool_maxsize,
+        pool_block,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def load_config(oci_profile: str) -> dict:
+    """Load and validate an OCI config profile once per process"""
+    return oci.config.from_file(profile_name=oci_profile)
+
+
+@functools.lru_cache(maxsize=4)
+def get_signer(oci_profile: str):
+    """Parse a profile's private key once and share the signer between clients"""
+    config = load_config(oci_profile)
+    # Mirror the SDK client constructors so every profile type they accept still works
+    if oci.util.AUTHENTICATION_TYPE_FIELD_NAME in config:
+        return oci.util.get_signer_from_authentication_type(config)
+    return oci.signer.Signer(
+        tenancy=config["tenancy"],
+        user=config["user"],
+        fingerprint=config["fingerprint"],
+        private_key_file_location=config.get("key_file"),
+        pass_phrase=oci.config.get_config_value_or_default(config, "pass_phrase"),
+        private_key_content=config.get("key_content"),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def get_object_storage_client(
+        oci_profile: str, concurrency: int = POOL_MAXSIZE
+) -> ObjectStorageClient:
+    """Build one Object Storage client per profile, with a pool sized for the concurrency"""
+    object_storage_client = oci.object_storage.ObjectStorageClient(
+        load_config(oci_profile),
+        signer=get_signer(oci_profile),
+        timeout=CLIENT_TIMEOUT,
+    )
+    configure_connection_pool(
+        object_storage_client, POOL_CONNECTIONS, max(POOL_MAXSIZE, concurrency)
+    )
+    return object_storage_client
+
+
+@functools.lru_cache(maxsize=4)
+def get_log_analytics_client(
+        oci_profile: str, concurrency: int = POOL_MAXSIZE
+) -> LogAnalyticsClient:
+    """Build one Log Analytics client per profile, with a pool sized for the concurrency"""
+    log_analytics_client = oci.log_analytics.LogAnalyticsClient(
+        load_config(oci_profile),
+        signer=get_signer(oci_profile),
+        timeout=CLIENT_TIMEOUT,
+    )
+    configure_connection_pool(
+        log_analytics_client, POOL_CONNECTIONS, max(POOL_MAXSIZE, concurrency)
+    )
+    return log_analytics_client
+
+
+@functools.lru_cache(maxsize=4)
+def get_namespace(object_storage_client: ObjectStorageClient) -> str:
+    """Look up the tenancy's Object Storage namespace once per client"""
+    namespace_response: Response = object_storage_client.get_namespace()
+    return namespace_response.data
+
+
+# Throttling and transient server errors; anything else (404, 409, ...) fails fast
+RETRIABLE_STATUSES = (429, 500, 502, 503, 504)
+
+# Calls wrapped in retry_transient opt out of the SDK's own default retries
+# (8 attempts, 600s budget) so the two layers don't multiply. List calls go
+# through oci.pagination instead and keep the SDK default, which retries each
+# page request and resumes from its page token
+SDK_NO_RETRY = oci.retry.NoneRetryStrategy()
+
+# Overall time budget per call, however many retries are allowed
+RETRY_BUDGET = 300
+
+# Replaced by configure_retries when the CLI overrides the limits
+_stop = stop_after_attempt(5) | stop_after_delay(RETRY_BUDGET)
+_backoff = wait_random_exponential(multiplier=0.5, max=15)
+
+
+def configure_retries(max_retries: int, max_backoff: float):
+    """Apply retry limits to every call wrapped in retry_transient"""
+    global _stop, _backoff
+    _stop = stop_after_attempt(max_retries + 1) | stop_after_delay(RETRY_BUDGET)
+    _backoff = wait_random_exponential(multiplier=0.5, max=max_backoff)
+
+
+def is_retriable(exception: BaseException) -> bool:
+    """Check whether an exception is a throttling, transient service or connection error"""
+    if isinstance(exception, oci.exceptions.ServiceError):
+        return exception.status in RETRIABLE_STATUSES
+    return isinstance(
+        exception,
+        (
+            oci.exceptions.RequestException,
+            oci.exceptions.ConnectTimeout,
+            ConnectionError,
+        ),
+    )
+
+
+def wait_retry_after(retry_state) -> float:
+    """Wait as long as the server's Retry-After asks, else back off exponentially with jitter"""
+    headers = getattr(retry_state.outcome.exception(), "headers", None) or {}
+    retry_after = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        # Keep the header within [0, retry budget], whatever the server sends
+        return max(0.0, min(float(retry_after), RETRY_BUDGET))
+    except (TypeError, ValueError):
+        return _backoff(retry_state)
+
+
+def stop_retrying(retry_state) -> bool:
+    """Stop once the configured retries or the time budget are used up"""
+    return _stop(retry_state)
+
+
+retry_transient = retry(
+    retry=retry_if_exception(is_retriable),
+    wait=wait_retry_after,
+    stop=stop_retrying,
+    reraise=True,
+)
+
+
+def with_client_request_id(fn):
+    """Tag every retried attempt of one logical call with the same opc-client-request-id"""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        kwargs.setdefault("opc_client_request_id", uuid.uuid4().hex)
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
+_END_OF_ITEMS = object()
+
+
+def prefetched(*sources: Iterator, depth: int = 1) -> Iterator:
+    """Yield from all sources while background threads fetch up to depth items ahead"""
+    buffer: Queue = Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def produce(items: Iterator):
+        try:
+            for item in items:
+                if stopped.is_set():
+                    break
+                buffer.put(item)
+        except BaseException as e:
+            buffer.put(e)
+        else:
+            buffer.put(_END_OF_ITEMS)
+
+    for source in sources:
+        threading.Thread(target=produce, args=(source,), daemon=True).start()
+
+    # Every producer ends with exactly one sentinel or exception, so blocking gets
+    # can count them down without polling
+    remaining = len(sources)
     try:
-        all_objects: list[ObjectVersionSummary] = []
-        next_page = None
+        while remaining:
+            item = buffer.get()
+            if item is _END_OF_ITEMS:
+                remaining -= 1
+            elif isinstance(item, BaseException):
+                remaining -= 1
+                raise item
+            else:
+                yield item
+    finally:
+        # If the consumer stopped early, drain so no producer stays blocked on a full buffer
+        stopped.set()
+        while remaining:
+            item = buffer.get()
+            if item is _END_OF_ITEMS or isinstance(item, BaseException):
+                remaining -= 1
+
+
+def paged_items(responses: Iterable[Response], resource: str) -> Iterator:
+    """Yield the items of each list response, logging every fetched page at debug level"""
+    for response in responses:
+        items = getattr(response.data, "items", response.data)
+        logger.debug(
+            "Fetched %s page, %d items, next=%s", resource, len(items), response.next_page
+        )
+        yield from items
+
+
+@contextmanager
+def listing_errors_logged(listing: str):
+    """Log an error that ends a listing early, re-raising a missing bucket"""
+    try:
+        yield
+    except Exception as e:
+        # empty_bucket reports a missing bucket so the bucket delete is skipped
+        if isinstance(e, oci.exceptions.ServiceError) and e.code == "BucketNotFound":
+            raise
+        logger.warning("Error listing %s: %s", listing, e)
 
-        while True:
-            response = object_storage_client.list_object_versions(
+
+def list_object_versions(
+        object_storage_client: ObjectStorageClient,
+        bucket_name: str,
+        namespace: str,
+        split_points: tuple[str, ...] = (),
+        page_size: int = LIST_PAGE_SIZE,
+) -> Iterator[ObjectVersionSummary]:
+    """Yield all object versions in a bucket, paginating each range between split_points concurrently"""
+    # Consecutive [start, end) ranges always cover the whole key space, whatever the split points
+    boundaries = sorted(set(split_points))
+    with listing_errors_logged(f"object versions for bucket '{bucket_name}'"):
+        pages = [
+            oci.pagination.list_call_get_all_results_generator(
+                object_storage_client.list_object_versions,
+                "response",
                 namespace_name=namespace,
                 bucket_name=bucket_name,
-                page=next_page,
-                limit=1000,
+                start=start,
+                end=end,
+                # Only name and version id are needed; never pay for sizes, etags or tiers
+                fields="name",
+                limit=page_size,
             )
+            for start, end in zip([None, *boundaries], [*boundaries, None])
+        ]
+        yield from paged_items(
+            prefetched(*pages, depth=len(pages)), "object version"
+        )
 
-            if response.data.items:
-                all_objects.extend(response.data.items)
-
-            # Check if there are more items
-            next_page = response.headers.get("opc-next-page")
-            if not next_page:
-                break
 
-        return all_objects
-    except Exception as e:
-        print(f"Error listing object versions: {e}")
-        return []
+@contextmanager
+def ignore_not_found():
+    """Treat a missing object, PAR or upload as deleted and let every other error through"""
+    try:
+        yield
+    except oci.exceptions.ServiceError as e:
+        # A retried delete, a concurrent run or a lifecycle policy may have removed it first;
+        # a bucket deleted mid-run is a real failure, not one more thing already gone
+        if e.status != 404 or e.code == "BucketNotFound":
+            raise
 
 
-@retry(stop=stop_after_attempt(4), wait=wait_fixed(10))
+@with_client_request_id
+@retry_transient
 def delete_object_with_retry(
         object_storage_client: ObjectStorageClient,
         namespace: str,
         bucket_name: str,
         object_name: str,
         version_id: str,
+        opc_client_request_id: str | None = None,
+):
+    """Delete an object version with retry mechanism, treating an already-deleted version as success"""
+    with ignore_not_found():
+        object_storage_client.delete_object(
+            namespace_name=namespace,
+            bucket_name=bucket_name,
+            object_name=object_name,
+            version_id=version_id,
+            opc_client_request_id=opc_client_request_id,
+            retry_strategy=SDK_NO_RETRY,
+        )
+    return True
+
+
+@retry_transient
+def delete_object_batch_with_retry(
+        object_storage_client: ObjectStorageClient,
+        namespace: str,
+        bucket_name: str,
+        objects: tuple[ObjectVersionSummary, ...],
 ):
-    """Delete an object version with retry mechanism"""
-    return object_storage_client.delete_object(
+    """Delete a batch of objects in one request"""
+    response: Response = object_storage_client.batch_delete_objects(
         namespace_name=namespace,
         bucket_name=bucket_name,
-        object_name=object_name,
-        version_id=version_id,
+        batch_delete_objects_details=BatchDeleteObjectsDetails(
+            objects=[
+                BatchDeleteObjectIdentifier(object_name=obj.name) for obj in objects
+            ],
+            is_skip_deleted_result=True,
+        ),
+        retry_strategy=SDK_NO_RETRY,
     )
 
+    # Objects that vanished in the meantime count as deleted, as with single deletes
+    failed = [f for f in response.data.failed or () if f.status_code != 404]
+    for failure in failed:
+        logger.warning(
+            "Error deleting %s: %s %s",
+            failure.object_name,
+            failure.status_code,
+            failure.error_message,
+        )
+    return not failed
 
-@retry(stop=stop_after_attempt(4), wait=wait_fixed(10))
-def delete_bucket_with_retry(
-        object_storage_client: ObjectStorageClient, namespace: str, bucket_name: str
+
+def delete_object_batch(
+        object_storage_client: ObjectStorageClient,
+        namespace: str,
+        bucket_name: str,
+        batch_unsupported: threading.Event,
+        objects: tuple[ObjectVersionSummary, ...],
 ):
-    """Delete a bucket with retry mechanism"""
+    """Delete a batch of objects, one request per object once the region rejects batches"""
+    if not batch_unsupported.is_set():
+        try:
+            return delete_object_batch_with_retry(
+                object_storage_client, namespace, bucket_name, objects
+            )
+        except oci.exceptions.ServiceError as e:
+            # Regions that don't serve the batch operation yet answer 501
+            if e.status != 501:
+                raise
+            logger.debug("Batch delete unavailable in bucket '%s': %s", bucket_name, e)
+            batch_unsupported.set()
+
+    # Each object is retried on its own, and one failure doesn't stop the rest
+    success = True
+    for obj in objects:
+        try:
+            delete_object_with_retry(
+                object_storage_client, namespace, bucket_name, obj.name, obj.version_id
+            )
+        except Exception as e:
+            logger.warning("Error deleting %s: %s", obj.name, e)
+            success = False
+    return success
+
+
+def use_batch_delete(
+        object_storage_client: ObjectStorageClient, namespace: str, bucket_name: str
+) -> bool:
+    """Check whether a bucket's objects can be removed with batch deletes"""
+    # Batch deletes address names, not versions, so they only empty unversioned buckets
     try:
-        object_storage_client.delete_bucket(
+        bucket_response: Response = object_storage_client.get_bucket(
             namespace_name=namespace, bucket_name=bucket_name
         )
-        print(f"\nBucket '{bucket_name}' deleted successfully")
-        return True
     except oci.exceptions.ServiceError as e:
-        if e.code == "BucketNotEmpty":
-            print(
-                f"\nBucket '{bucket_name}' is not empty. Please ensure all objects are deleted first."
-            )
-        else:
-            print(f"\nError deleting bucket '{bucket_name}': {e}")
+        # A missing bucket is reported once, by the listing
+        if e.status != 404:
+            logger.warning("Error reading bucket '%s': %s", bucket_name, e)
+        return False
+    if bucket_response.data.versioning != "Disabled":
+        tqdm.write(f"Bucket '{bucket_name}' is versioned; deleting versions one by one")
         return False
+    return True
 
 
-def verify_bucket_exists(
+@retry_transient
+def delete_bucket_with_retry(
         object_storage_client: ObjectStorageClient, namespace: str, bucket_name: str
 ):
-    """Verify if a bucket exists"""
+    """Delete a bucket with retry mechanism"""
     try:
-        object_storage_client.get_bucket(
-            namespace_name=namespace, bucket_name=bucket_name
+        object_storage_client.delete_bucket(
+            namespace_name=namespace,
+            bucket_name=bucket_name,
+            retry_strategy=SDK_NO_RETRY,
         )
+        tqdm.write(f"Bucket '{bucket_name}' deleted successfully")
         return True
     except oci.exceptions.ServiceError as e:
-        if e.code == "BucketNotFound":
-            print(f"\nBucket '{bucket_name}' does not exist.")
-        else:
-            print(f"\nError verifying bucket '{bucket_name}': {e}")
+        # Callers decide whether to empty the bucket again
+        if is_retriable(e) or e.code == "BucketNotEmpty":
+            raise
+        logger.warning("Error deleting bucket '%s': %s", bucket_name, e)
         return False
 
 
 def list_preauthenticated_requests(
-        object_storage_client: ObjectStorageClient, namespace: str, bucket_name: str
-):
-    """List all preauthenticated requests in a bucket with pagination"""
-    try:
-        all_pars = []
-        next_page = None
-
-        while True:
-            response = object_storage_client.list_preauthenticated_requests(
-                namespace_name=namespace,
-                bucket_name=bucket_name,
-                page=next_page,
-                limit=1000,
-            )
-
-            if response.data:
-                all_pars.extend(response.data)
-
-            # Check if there are more items
-            next_page = response.headers.get("opc-next-page")
-            if not next_page:
-                break
-
-        return all_pars
-    except Exception as e:
-        print(
-            f"Error listing preauthenticated requests for bucket '{bucket_name}': {e}"
+        object_storage_client: ObjectStorageClient,
+        namespace: str,
+        bucket_name: str,
+        page_size: int = LIST_PAGE_SIZE,
+) -> Iterator[PreauthenticatedRequestSummary]:
+    """Yield all preauthenticated requests in a bucket, fetching the next page in the background"""
+    with listing_errors_logged(f"preauthenticated requests for bucket '{bucket_name}'"):
+        # Most buckets have no PARs, so probe with a one-item page before paging in bulk
+        probe: Response = object_storage_client.list_preauthenticated_requests(
+            namespace_name=namespace, bucket_name=bucket_name, limit=1
         )
-        return []
+        yield from paged_items([probe], "preauthenticated request")
+        if probe.has_next_page:
+            yield from paged_items(
+                prefetched(
+                    oci.pagination.list_call_get_all_results_generator(
+                        object_storage_client.list_preauthenticated_requests,
+                        "response",
+                        namespace_name=namespace,
+                        bucket_name=bucket_name,
+                        page=probe.next_page,
+                        limit=page_size,
+                    )
+                ),
+                "preauthenticated request",
+            )
 
 
-@retry(stop=stop_after_attempt(4), wait=wait_fixed(10))
+@with_client_request_id
+@retry_transient
 def delete_par_with_retry(
         object_storage_client: ObjectStorageClient,
         namespace: str,
         bucket_name: str,
         par_id: str,
+        opc_client_request_id: str | None = None,
 ):
-    """Delete a preauthenticated request with retry mechanism"""
-    try:
+    """Delete a preauthenticated request with retry mechanism, treating an already-deleted one as success"""
+    with ignore_not_found():
         object_storage_client.delete_preauthenticated_request(
-            namespace_name=namespace, bucket_name=bucket_name, par_id=par_id
+            namespace_name=namespace,
+            bucket_name=bucket_name,
+            par_id=par_id,
+            opc_client_request_id=opc_client_request_id,
+            retry_strategy=SDK_NO_RETRY,
         )
-        return True
-    except Exception as e:
-        print(f"\nError deleting preauthenticated request {par_id}: {e}")
-        return False
+    return True
 
 
 def list_multipart_uploads(
-        object_storage_client: ObjectStorageClient, namespace: str, bucket_name: str
-) -> list[MultipartUploadPartSummary]:
-    """List all multipart uploads in a bucket with pagination"""
-    try:
-        all_uploads: list[MultipartUploadPartSummary] = []
-        next_page = None
-
-        while True:
-            response = object_storage_client.list_multipart_uploads(
-                namespace_name=namespace,
-                bucket_name=bucket_name,
-                page=next_page,
-                limit=1000,
-            )
-
-            if response.data:
-                all_uploads.extend(response.data)
-
-            # Check if there are more items
-            next_page = response.headers.get("opc-next-page")
-            if not next_page:
-                break
-
-        return all_uploads
-    except Exception as e:
-        print(f"Error listing multipart uploads for bucket '{bucket_name}': {e}")
-        return []
+        object_storage_client: ObjectStorageClient,
+        namespace: str,
+        bucket_name: str,
+        page_size: int = LIST_PAGE_SIZE,
+) -> Iterator[MultipartUpload]:
+    """Yield all multipart uploads in a bucket, fetching the next page in the background"""
+    with listing_errors_logged(f"multipart uploads for bucket '{bucket_name}'"):
+        yield from paged_items(
+            prefetched(
+                oci.pagination.list_call_get_all_results_generator(
+                    object_storage_client.list_multipart_uploads,
+                    "response",
+                    namespace_name=namespace,
+                    bucket_name=bucket_name,
+                    limit=page_size,
+                )
+            ),
+            "multipart upload",
+        )
 
 
-@retry(stop=stop_after_attempt(4), wait=wait_fixed(10))
+@with_client_request_id
+@retry_transient
 def abort_multipart_upload_with_retry(
         object_storage_client: ObjectStorageClient,
         namespace: str,
         bucket_name: str,
         object_name: str,
         upload_id: str,
+        opc_client_request_id: str | None = None,
 ):
-    """Abort a multipart upload with retry mechanism"""
-    try:
+    """Abort a multipart upload with retry mechanism, treating an already-aborted one as success"""
+    with ignore_not_found():
         object_storage_client.abort_multipart_upload(
             namespace_name=namespace,
             bucket_name=bucket_name,
             object_name=object_name,
             upload_id=upload_id,
+            opc_client_request_id=opc_client_request_id,
+            retry_strategy=SDK_NO_RETRY,
+        )
+    return True
+
+
+@retry_transient
+def apply_expiry_lifecycle_policy(
+        object_storage_client: ObjectStorageClient, namespace: str, bucket_name: str
+):
+    """Replace the bucket's lifecycle policy with rules that expire all objects, versions and uploads"""
+    rules = [
+        ObjectLifecycleRule(
+            name="cleanup-expire-objects",
+            target="objects",
+            action="DELETE",
+            time_amount=1,
+            time_unit="DAYS",
+            is_enabled=True,
+        ),
+        ObjectLifecycleRule(
+            name="cleanup-expire-previous-versions",
+            target="previous-object-versions",
+            action="DELETE",
+            time_amount=1,
+            time_unit="DAYS",
+            is_enabled=True,
+        ),
+        ObjectLifecycleRule(
+            name="cleanup-abort-multipart-uploads",
+            target="multipart-uploads",
+            action="ABORT",
+            time_amount=1,
+            time_unit="DAYS",
+            is_enabled=True,
+        ),
+    ]
+    try:
+        object_storage_client.put_object_lifecycle_policy(
+            namespace_name=namespace,
+            bucket_name=bucket_name,
+            put_object_lifecycle_policy_details=PutObjectLifecyclePolicyDetails(
+                items=rules
+            ),
+            retry_strategy=SDK_NO_RETRY,
         )
+        tqdm.write(f"Lifecycle expiry policy applied to bucket '{bucket_name}'")
         return True
-    except Exception as e:
-        print(
-            f"\nError aborting multipart upload {upload_id} for object {object_name}: {e}"
+    except oci.exceptions.ServiceError as e:
+        if is_retriable(e):
+            raise
+        logger.warning(
+            "Error applying lifecycle policy to bucket '%s': %s", bucket_name, e
         )
         return False
 
 
-def delete_object_worker(
+def progress_bar(total: int, desc: str, **kwargs) -> tqdm:
+    """Create a transient per-phase progress bar with the shared format and redraw throttling"""
+    return tqdm(
+        total=total,
+        desc=desc,
+        bar_format=PROGRESS_BAR_FORMAT,
+        leave=False,
+        mininterval=0.25,
+        smoothing=0.05,
+        **kwargs,
+    )
+
+
+def submit_bounded(executor: ThreadPoolExecutor, fn, items, max_pending: int):
+    """Submit fn(item) per item with at most max_pending futures in flight, yielding (item, future) as they complete"""
+    # Look up submit once; this loop runs for every listed item
+    pending = {}
+    submit = executor.submit
+    for item in items:
+        if len(pending) >= max_pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future
+        pending[submit(fn, item)] = item
+
+    for future in as_completed(pending):
+        yield pending[future], future
+
+
+def track_listed(items, pbar, item_size=None):
+    """Yield items while growing the progress bar total to the number listed so far"""
+    for item in items:
+        pbar.total += item_size(item) if item_size else 1
+        yield item
+
+
+def parallel_apply(
+        executor: ThreadPoolExecutor,
+        fn,
+        items,
+        num_workers: int,
+        desc: str,
+        describe,
+        item_size=None,
+        **pbar_kwargs,
+) -> int:
+    """Run fn over streamed items on the executor under a progress bar, returning how many were listed"""
+    items = iter(items)
+    first_item = next(items, None)
+    if first_item is None:
+        return 0
+
+    # describe() builds a string per item, so only pay for it when --verbose is on
+    log_each = logger.isEnabledFor(logging.DEBUG)
+    with progress_bar(0, desc, **pbar_kwargs) as pbar:
+        update = pbar.update
+        for item, future in submit_bounded(
+                executor,
+                fn,
+                track_listed(chain([first_item], items), pbar, item_size),
+                num_workers * MAX_PENDING_PER_WORKER,
+        ):
+            try:
+                future.result()
+                if log_each:
+                    logger.debug("Processed %s", describe(item))
+            except Exception as e:
+                logger.warning("Error processing %s: %s", describe(item), e)
+
+            update(item_size(item) if item_size else 1)
+
+        return pbar.total
+
+
+def empty_bucket(
         object_storage_client: ObjectStorageClient,
-        namespace: str,
         bucket_name: str,
-        queue: Queue[ObjectVersionSummary],
-        progress_lock: Lock,
-        obj_pbar,
-):
-    """Worker function to delete objects from the queue"""
-    while True:
-        try:
-            item: ObjectVersionSummary = queue.get_nowait()
-            object_name = item.name
-            version_id = item.version_id
+        namespace: str,
+        num_workers: int,
+        list_split_points: tuple[str, ...],
+        executor: ThreadPoolExecutor | None,
+        page_size: int,
+        phase_executor: ThreadPoolExecutor | None,
+        batch_unsupported: threading.Event | None,
+) -> bool:
+    """Delete every object version, PAR and multipart upload in a bucket, returning False if it doesn't exist"""
+    # Stream object versions so deletes start while later pages are still being listed.
+    # Version listing covers unversioned buckets too (one version per object), so no
+    # get_bucket pre-flight is needed to pick between list_objects and list_object_versions
+    objects: Iterator[ObjectVersionSummary] = list_object_versions(
+        object_storage_client, bucket_name, namespace, list_split_points, page_size
+    )
+    object_size = None
+    if batch_unsupported is not None:
+        # One request per batch of names; the bar still counts objects
+        objects = batched(objects, BULK_DELETE_BATCH_SIZE)
+        object_size = len
+        delete_objects = functools.partial(
+            delete_object_batch,
+            object_storage_client,
+            namespace,
+            bucket_name,
+            batch_unsupported,
+        )
 
-            try:
-                delete_object_with_retry(
+        def describe_objects(batch: tuple[ObjectVersionSummary, ...]) -> str:
+            return f"batch of {len(batch)} from {batch[0].name}"
+    else:
+        def delete_objects(obj: ObjectVersionSummary):
+            return delete_object_with_retry(
+                object_storage_client, namespace, bucket_name, obj.name, obj.version_id
+            )
+
+        def describe_objects(obj: ObjectVersionSummary) -> str:
+            return f"{obj.name} | Version ID: {obj.version_id}"
+
+    # Objects, PARs and multipart uploads are independent, so all three listings start
+    # at once and a missing or empty bucket costs one round trip rather than three in
+    # a row; both pools are reused across buckets when the caller provides them
+    with (
+            nullcontext(executor)
+            if executor
+            else ThreadPoolExecutor(max_workers=num_workers) as executor,
+            nullcontext(phase_executor)
+            if phase_executor
+            else ThreadPoolExecutor(max_workers=BUCKET_PHASES) as phase_executor,
+    ):
+        phases = {
+            # Redraw the object bar at most every 0.25s / 128 items
+            phase_executor.submit(
+                parallel_apply,
+                executor,
+                delete_objects,
+                objects,
+                num_workers,
+                f"Deleting objects in {bucket_name}",
+                describe_objects,
+                object_size,
+                miniters=128,
+            ): "objects",
+            phase_executor.submit(
+                parallel_apply,
+                executor,
+                lambda par: delete_par_with_retry(
+                    object_storage_client, namespace, bucket_name, par.id
+                ),
+                list_preauthenticated_requests(
+                    object_storage_client, namespace, bucket_name, page_size
+                ),
+                num_workers,
+                f"Deleting preauthenticated requests in {bucket_name}",
+                lambda par: f"PAR {par.id}",
+            ): "preauthenticated requests",
+            phase_executor.submit(
+                parallel_apply,
+                executor,
+                lambda upload: abort_multipart_upload_with_retry(
                     object_storage_client,
                     namespace,
                     bucket_name,
-                    object_name,
-                    version_id,
-                )
-                with progress_lock:
-                    percentage = (obj_pbar.n + 1) / obj_pbar.total * 100
-                    obj_pbar.set_postfix_str(
-                        f"[{percentage:.1f}%] Deleted: {object_name}"
-                    )
-                    obj_pbar.update(1)
-            except Exception as e:
-                print(f"\nError deleting {object_name} | Version ID: {version_id}: {e}")
-                with progress_lock:
-                    obj_pbar.update(1)
-            finally:
-                queue.task_done()
+                    upload.object,
+                    upload.upload_id,
+                ),
+                list_multipart_uploads(
+                    object_storage_client, namespace, bucket_name, page_size
+                ),
+                num_workers,
+                f"Aborting multipart uploads in {bucket_name}",
+                lambda upload: f"multipart upload {upload.object}",
+            ): "multipart uploads",
+        }
 
-        except Empty:
-            break
+        bucket_missing = False
+        for future in as_completed(phases):
+            try:
+                listed = future.result()
+            except oci.exceptions.ServiceError as e:
+                if e.code != "BucketNotFound":
+                    raise
+                bucket_missing = True
+                continue
+            if not listed:
+                tqdm.write(f"No {phases[future]} found in bucket '{bucket_name}'")
+
+    return not bucket_missing
 
 
 def clean_up_bucket(
@@ -249,131 +857,89 @@ def clean_up_bucket(
         bucket_pbar=None,
         delete_bucket=True,
         num_workers=1,
+        lifecycle_mode=False,
+        list_split_points: tuple[str, ...] = (),
+        executor: ThreadPoolExecutor | None = None,
+        page_size: int = LIST_PAGE_SIZE,
+        phase_executor: ThreadPoolExecutor | None = None,
+        bulk_delete: bool = False,
 ):
     """Delete all objects from a bucket and then delete the bucket itself if delete_bucket is True"""
     bucket_desc = f"Cleaning bucket: {bucket_name}"
     if bucket_pbar:
         bucket_pbar.set_description(bucket_desc)
     else:
-        print(f"\n{bucket_desc}")
+        tqdm.write(bucket_desc)
 
-    # Verify bucket exists
-    if not verify_bucket_exists(object_storage_client, namespace, bucket_name):
+    # Let Object Storage expire the contents server-side; a later run deletes the bucket
+    if lifecycle_mode:
+        try:
+            success = apply_expiry_lifecycle_policy(
+                object_storage_client, namespace, bucket_name
+            )
+        except oci.exceptions.ServiceError as e:
+            logger.warning(
+                "Error applying lifecycle policy to bucket '%s': %s", bucket_name, e
+            )
+            success = False
         if bucket_pbar:
             bucket_pbar.update(1)
-        return False
-
-    # Get list of object versions
-    objects: list[ObjectVersionSummary] = list_object_versions(
-        object_storage_client, bucket_name, namespace
+        return success
+
+    tqdm.write(f"Running with {num_workers} workers")
+    # Set by the first batch the region rejects, so later batches go object by object
+    batch_unsupported = (
+        threading.Event()
+        if bulk_delete and use_batch_delete(object_storage_client, namespace, bucket_name)
+        else None
     )
-
-    if not objects:
-        print(f"No objects found in bucket '{bucket_name}'")
-    else:
-        # Create queue and progress bar for object deletion
-        object_queue: Queue[ObjectVersionSummary] = Queue()
-        progress_lock = Lock()
-        print(f"Running with {num_workers} workers")
-
-        # Create progress bar with percentage format
-        with tqdm(
-                total=len(objects),
-                desc=f"Deleting objects in {bucket_name}",
-                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] {postfix}",
-                leave=False,
-        ) as obj_pbar:
-            # Fill the queue with objects
-            for item in objects:
-                object_queue.put(item)
-
-            # Create and start worker threads
-            with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                # Submit worker tasks
-                futures = [
-                    executor.submit(
-                        delete_object_worker,
-                        object_storage_client,
-                        namespace,
-                        bucket_name,
-                        object_queue,
-                        progress_lock,
-                        obj_pbar,
-                    )
-                    for _ in range(num_workers)
-                ]
-
-                # Wait for all tasks to complete
-                for future in futures:
-                    future.result()
-
-                # Wait for queue to be empty
-                object_queue.join()
-
-    # Delete all preauthenticated requests
-    pars = list_preauthenticated_requests(object_storage_client, namespace, bucket_name)
-    if pars:
-        with tqdm(
-                total=len(pars),
-                desc=f"Deleting preauthenticated requests in {bucket_name}",
-                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] {postfix}",
-                leave=False,
-        ) as par_pbar:
-            for par in pars:
-                try:
-                    delete_par_with_retry(
-                        object_storage_client, namespace, bucket_name, par.id
-                    )
-                    percentage = (par_pbar.n + 1) / par_pbar.total * 100
-                    par_pbar.set_postfix_str(
-                        f"[{percentage:.1f}%] Deleted PAR: {par.id}"
-                    )
-                except Exception as e:
-                    print(f"\nError deleting PAR {par.id}: {e}")
-
-                par_pbar.update(1)
-    else:
-        print(f"No preauthenticated requests found in bucket '{bucket_name}'")
-
-    # Abort all multipart uploads
-    multipart_uploads = list_multipart_uploads(
-        object_storage_client, namespace, bucket_name
+    empty = functools.partial(
+        empty_bucket,
+        object_storage_client,
+        bucket_name,
+        namespace,
+        num_workers=num_workers,
+        list_split_points=list_split_points,
+        executor=executor,
+        page_size=page_size,
+        phase_executor=phase_executor,
+        batch_unsupported=batch_unsupported,
     )
-    if multipart_uploads:
-        with tqdm(
-                total=len(multipart_uploads),
-                desc=f"Aborting multipart uploads in {bucket_name}",
-                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] {postfix}",
-                leave=False,
-        ) as upload_pbar:
-            for upload in multipart_uploads:
-                try:
-                    abort_multipart_upload_with_retry(
-                        object_storage_client,
-                        namespace,
-                        bucket_name,
-                        upload.object,
-                        upload.upload_id,
-                    )
-                    percentage = (upload_pbar.n + 1) / upload_pbar.total * 100
-                    upload_pbar.set_postfix_str(
-                        f"[{percentage:.1f}%] Aborted upload: {upload.object}"
-                    )
-                except Exception as e:
-                    print(f"\nError aborting multipart upload for {upload.object}: {e}")
-
-                upload_pbar.update(1)
-    else:
-        print(f"No multipart uploads found in bucket '{bucket_name}'")
+    if not empty():
+        logger.warning("Bucket '%s' does not exist.", bucket_name)
+        if bucket_pbar:
+            bucket_pbar.update(1)
+        return False
 
-    # After all objects, PARs, and multipart uploads are deleted, delete the bucket if requested
+    # After all objects, PARs, and multipart uploads are deleted, delete the bucket if requested.
+    # Writers that raced the cleanup leave it non-empty, so empty it again a bounded number of times
     success = True
     if delete_bucket:
-        success = delete_bucket_with_retry(
-            object_storage_client, namespace, bucket_name
-        )
+        for escalation in range(BUCKET_NOT_EMPTY_RETRIES + 1):
+            try:
+                success = delete_bucket_with_retry(
+                    object_storage_client, namespace, bucket_name
+                )
+            except oci.exceptions.ServiceError as e:
+                if e.code == "BucketNotEmpty" and escalation < BUCKET_NOT_EMPTY_RETRIES:
+                    tqdm.write(f"Bucket '{bucket_name}' is not empty yet; cleaning it again")
+                    if empty():
+                        continue
+                    # Someone else deleted it in the meantime, as on the first pass
+                    logger.warning("Bucket '%s' does not exist.", bucket_name)
+                    success = False
+                    break
+                if e.code == "BucketNotEmpty":
+                    logger.warning(
+                        "Bucket '%s' is not empty. Please ensure all objects are deleted first.",
+                        bucket_name,
+                    )
+                else:
+                    logger.warning("Error deleting bucket '%s': %s", bucket_name, e)
+                success = False
+            break
     else:
-        print(f"\nSkipping bucket deletion for '{bucket_name}' as requested")
+        tqdm.write(f"Skipping bucket deletion for '{bucket_name}' as requested")
 
     if bucket_pbar:
         bucket_pbar.update(1)
@@ -382,86 +948,114 @@ def clean_up_bucket(
 
 
 def clean_up_buckets_from_file(
-        oci_profile: str,
+        object_storage_client: ObjectStorageClient,
         bucket_file: str,
         namespace: str,
         delete_bucket: bool = True,
         num_workers: int = 1,
+        lifecycle_mode: bool = False,
+        bucket_concurrency: int = BUCKET_CONCURRENCY,
+        list_split_points: tuple[str, ...] = (),
+        page_size: int = LIST_PAGE_SIZE,
+        bulk_delete: bool = False,
 ):
-    """Clean up multiple buckets listed in a file"""
-    # Load OCI config from specified profile
-    config = oci.config.from_file(profile_name=oci_profile)
-    object_storage_client: ObjectStorageClient = oci.object_storage.ObjectStorageClient(
-        config
-    )
-
+    """Clean up multiple buckets listed in a file, several buckets at a time"""
     # Read bucket names from file
     try:
         with open(bucket_file, "r") as f:
             buckets = [line.strip() for line in f if line.strip()]
     except FileNotFoundError:
-        print(f"Error: Bucket list file '{bucket_file}' not found.")
+        logger.error("Error: Bucket list file '%s' not found.", bucket_file)
         return
     except Exception as e:
-        print(f"Error reading bucket list file: {e}")
+        logger.error("Error reading bucket list file: %s", e)
         return
 
     if not buckets:
-        print("No buckets found in the file.")
+        tqdm.write("No buckets found in the file.")
         return
 
-    print(f"\nStarting cleanup of {len(buckets)} buckets...")
+    tqdm.write(f"\nStarting cleanup of {len(buckets)} buckets...")
 
-    # Create progress bar for buckets
+    # Create progress bar for buckets, advanced from this thread as buckets finish.
+    # Buckets run on their own pool and share one phase pool and one delete pool,
+    # so threads are started once for the whole file instead of per bucket. Each
+    # pool only waits on the next one down, so sharing them cannot deadlock
     with tqdm(total=len(buckets), desc="Overall progress", position=0) as bucket_pbar:
-        for bucket_name in buckets:
-            clean_up_bucket(
-                object_storage_client,
-                bucket_name,
-                namespace,
-                bucket_pbar,
-                delete_bucket,
-                num_workers,
-            )
+        with (
+            ThreadPoolExecutor(max_workers=bucket_concurrency) as bucket_executor,
+            ThreadPoolExecutor(
+                max_workers=BUCKET_PHASES * bucket_concurrency
+            ) as phase_executor,
+            ThreadPoolExecutor(
+                max_workers=num_workers * bucket_concurrency
+            ) as delete_executor,
+        ):
+            futures = {
+                bucket_executor.submit(
+                    clean_up_bucket,
+                    object_storage_client,
+                    bucket_name,
+                    namespace,
+                    None,
+                    delete_bucket,
+                    num_workers,
+                    lifecycle_mode,
+                    list_split_points,
+                    delete_executor,
+                    page_size,
+                    phase_executor,
+                    bulk_delete,
+                ): bucket_name
+                for bucket_name in buckets
+            }
+
+            for future in as_completed(futures):
+                bucket_name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning("Error cleaning bucket '%s': %s", bucket_name, e)
+
+                # Let update() below do the only redraw for this bucket
+                bucket_pbar.set_postfix_str(f"Finished: {bucket_name}", refresh=False)
+                bucket_pbar.update(1)
 
 
 @click.group()
-def cli():
+@click.option("--verbose", is_flag=True, help="Log every deleted resource")
+@click.pass_context
+def cli(ctx: click.Context, verbose: bool):
     """OCI cleanup utilities"""
-    pass
+    listener = configure_logging(verbose)
+    ctx.call_on_close(listener.stop)
 
 
 def list_log_analytics_entities(
-        log_analytics_client: LogAnalyticsClient, compartment_id: str, namespace: str
-) -> list[LogAnalyticsEntitySummary]:
-    """List all log analytics entities in a compartment with pagination"""
+        log_analytics_client: LogAnalyticsClient,
+        compartment_id: str,
+        namespace: str,
+        page_size: int = LIST_PAGE_SIZE,
+) -> Iterator[LogAnalyticsEntitySummary]:
+    """Yield all log analytics entities in a compartment, fetching the next page in the background"""
     try:
-        all_entities: list[LogAnalyticsEntitySummary] = []
-        next_page = None
-
-        while True:
-            response = log_analytics_client.list_log_analytics_entities(
-                namespace_name=namespace,
-                compartment_id=compartment_id,
-                page=next_page,
-                limit=1000,
-            )
-
-            if response.data.items:
-                all_entities.extend(response.data.items)
-
-            # Check if there are more items
-            next_page = response.headers.get("opc-next-page")
-            if not next_page:
-                break
-
-        return all_entities
+        yield from paged_items(
+            prefetched(
+                oci.pagination.list_call_get_all_results_generator(
+                    log_analytics_client.list_log_analytics_entities,
+                    "response",
+                    namespace_name=namespace,
+                    compartment_id=compartment_id,
+                    limit=page_size,
+                )
+            ),
+            "log analytics entity",
+        )
     except Exception as e:
-        print(f"Error listing log analytics entities: {e}")
-        return []
+        logger.warning("Error listing log analytics entities: %s", e)
 
 
-@retry(stop=stop_after_attempt(4), wait=wait_fixed(10))
+@retry_transient
 def delete_log_analytics_entity_with_retry(
         log_analytics_client: LogAnalyticsClient, namespace: str, entity_id: str
 ):
@@ -470,10 +1064,13 @@ def delete_log_analytics_entity_with_retry(
         log_analytics_client.delete_log_analytics_entity(
             namespace_name=namespace,
             log_analytics_entity_id=entity_id,
+            retry_strategy=SDK_NO_RETRY,
         )
         return True
     except Exception as e:
-        print(f"\nError deleting log analytics entity {entity_id}: {e}")
+        if is_retriable(e):
+            raise
+        logger.warning("Error deleting log analytics entity %s: %s", entity_id, e)
         return False
 
 
@@ -482,96 +1079,45 @@ def clean_log_analytics_entities(
         compartment_id: str,
         namespace: str,
         num_workers=1,
+        page_size: int = LIST_PAGE_SIZE,
 ):
     """Delete all log analytics entities in a compartment"""
-    # Get list of log analytics entities
-    entities: list[LogAnalyticsEntitySummary] = list_log_analytics_entities(
-        log_analytics_client, compartment_id, namespace
+    # Stream log analytics entities so deletes start while later pages are still being listed
+    entities: Iterator[LogAnalyticsEntitySummary] = list_log_analytics_entities(
+        log_analytics_client, compartment_id, namespace, page_size
     )
+    first_entity = next(entities, None)
 
-    if not entities:
-        print(f"No log analytics entities found in compartment '{compartment_id}'")
+    if first_entity is None:
+        tqdm.write(f"No log analytics entities found in compartment '{compartment_id}'")
         return
 
-    print(f"\nFound {len(entities)} log analytics entities to delete")
-
-    # Create queue and progress bar for entity deletion
-    entity_queue: Queue[LogAnalyticsEntitySummary] = Queue()
-    progress_lock: Lock = Lock()
-    print(f"Running with {num_workers} workers")
-
-    # Create progress bar with percentage format
-    with tqdm(
-            total=len(entities),
-            desc="Deleting log analytics entities",
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] {postfix}",
-            leave=False,
-    ) as entity_pbar:
-        # Fill the queue with entities
-        for entity in entities:
-            entity_queue.put(entity)
-
-        # Create and start worker threads
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            # Submit worker tasks
-            futures = [
-                executor.submit(
-                    delete_log_analytics_entity_worker,
-                    log_analytics_client,
-                    namespace,
-                    entity_queue,
-                    progress_lock,
-                    entity_pbar,
-                )
-                for _ in range(num_workers)
-            ]
-
-            # Wait for all tasks to complete
-            for future in futures:
-                future.result()
-
-            # Wait for queue to be empty
-            entity_queue.join()
-
-
-def delete_log_analytics_entity_worker(
-        log_analytics_client: LogAnalyticsClient,
-        namespace: str,
-        queue: Queue[LogAnalyticsEntitySummary],
-        progress_lock: Lock,
-        entity_pbar,
-):
-    """Worker function to delete log analytics entities from the queue"""
-    while True:
-        try:
-            entity: LogAnalyticsEntitySummary = queue.get_nowait()
-            entity_id = entity.id
-            entity_name = entity.name
-
-            try:
-                delete_log_analytics_entity_with_retry(
-                    log_analytics_client, namespace, entity_id
-                )
-                with progress_lock:
-                    percentage = (entity_pbar.n + 1) / entity_pbar.total * 100
-                    entity_pbar.set_postfix_str(
-                        f"[{percentage:.1f}%] Deleted: {entity_name}"
-                    )
-                    entity_pbar.update(1)
-            except Exception as e:
-                print(f"\nError deleting entity {entity_name} | ID: {entity_id}: {e}")
-                with progress_lock:
-                    entity_pbar.update(1)
-            finally:
-                queue.task_done()
+    tqdm.write(f"Running with {num_workers} workers")
+
+    # Only this thread touches the bar, so workers never contend on tqdm's lock;
+    # redraw at most every 0.25s / 128 entities
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        parallel_apply(
+            executor,
+            lambda entity: delete_log_analytics_entity_with_retry(
+                log_analytics_client, namespace, entity.id
+            ),
+            chain([first_entity], entities),
+            num_workers,
+            "Deleting log analytics entities",
+            lambda entity: f"entity {entity.name} | ID: {entity.id}",
+            miniters=128,
+        )
 
-        except Empty:
-            break
 
 @cli.command(name="clean-bucket")
 @click.option(
     "--oci-profile", required=True, help="OCI profile to use from the config file"
 )
+@click.option(
+    "--namespace",
+    help="Object Storage namespace (looked up from the tenancy when omitted)",
+)
 @click.option("--bucket-name", help="Single bucket name to clean up")
 @click.option(
     "--bucket-file",
@@ -579,10 +1125,19 @@ def delete_log_analytics_entity_worker(
     help="File containing list of buckets to clean up (one per line)",
 )
 @click.option(
-    "--max-retries", type=int, default=4, help="Maximum number of retry attempts"
+    "--max-retries",
+    type=click.IntRange(min=0),
+    default=4,
+    show_default=True,
+    help="Retries per request after throttling or a transient error",
 )
 @click.option(
-    "--retry-delay", type=int, default=10, help="Delay between retries in seconds"
+    "--retry-delay",
+    type=click.FloatRange(min=0),
+    default=15,
+    show_default=True,
+    help="Upper bound in seconds on the jittered exponential backoff between "
+         "retries; a Retry-After from the service takes precedence",
 )
 @click.option(
     "--delete-bucket/--no-delete-bucket",
@@ -591,18 +1146,64 @@ def delete_log_analytics_entity_worker(
 )
 @click.option(
     "--workers",
-    type=int,
-    default=1,
-    help="Number of worker threads for parallel processing",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help="Number of concurrent delete requests per bucket",
+)
+@click.option(
+    "--bucket-concurrency",
+    type=click.IntRange(min=1),
+    default=BUCKET_CONCURRENCY,
+    show_default=True,
+    help="Number of buckets from --bucket-file cleaned at the same time",
+)
+@click.option(
+    "--lifecycle-mode",
+    is_flag=True,
+    default=False,
+    help="Install a lifecycle policy that expires all objects, versions and multipart "
+         "uploads instead of deleting them one by one. Re-run without this flag after "
+         "the policy has emptied the bucket to delete it. Requires an IAM policy "
+         "allowing the Object Storage service to manage objects in the compartment",
+)
+@click.option(
+    "--bulk-delete",
+    is_flag=True,
+    default=False,
+    help="Delete objects of unversioned buckets in batches of "
+         f"{BULK_DELETE_BATCH_SIZE} per request. Versioned buckets, and regions "
+         "without batch delete, fall back to one request per object",
+)
+@click.option(
+    "--list-split-at",
+    "list_split_points",
+    multiple=True,
+    help="Object name at which to split version listing into concurrently listed "
+         "ranges; repeat to add more ranges (e.g. --list-split-at 4 --list-split-at 8). "
+         "Spreading splits over how names are actually distributed balances the ranges",
+)
+@click.option(
+    "--list-page-size",
+    type=click.IntRange(1, LIST_PAGE_SIZE),
+    default=LIST_PAGE_SIZE,
+    show_default=True,
+    help="Items requested per list call; run with --verbose to see what each page returned",
 )
 def clean_bucket(
         oci_profile: str,
+        namespace: str,
         bucket_name: str,
         bucket_file: str,
-        max_retries: str,
-        retry_delay: str,
+        max_retries: int,
+        retry_delay: float,
         delete_bucket: bool,
         workers: int,
+        bucket_concurrency: int,
+        lifecycle_mode: bool,
+        bulk_delete: bool,
+        list_split_points: tuple[str, ...],
+        list_page_size: int,
 ):
     """Clean up OCI buckets by deleting their contents and optionally the buckets themselves"""
     if not bucket_name and not bucket_file:
@@ -613,17 +1214,27 @@ def clean_bucket(
     if bucket_name and bucket_file:
         raise click.UsageError("Cannot specify both --bucket-name and --bucket-file")
 
-    # Initialize OCI client
-    config = oci.config.from_file(profile_name=oci_profile)
-    object_storage_client: ObjectStorageClient = oci.object_storage.ObjectStorageClient(
-        config
-    )
-    namespace_response: Response = object_storage_client.get_namespace()
-    namespace: str = namespace_response.data
+    configure_retries(max_retries, retry_delay)
+
+    # Initialize a single OCI client shared by every bucket, with a socket per in-flight
+    # request: the deletes plus one listing per phase and per extra split range
+    per_bucket = workers + BUCKET_PHASES + len(set(list_split_points))
+    concurrency = per_bucket * (bucket_concurrency if bucket_file else 1)
+    object_storage_client = get_object_storage_client(oci_profile, concurrency)
+    namespace = namespace or get_namespace(object_storage_client)
 
     if bucket_file:
         clean_up_buckets_from_file(
-            oci_profile, bucket_file, namespace, delete_bucket, workers
+            object_storage_client,
+            bucket_file,
+            namespace,
+            delete_bucket,
+            workers,
+            lifecycle_mode,
+            bucket_concurrency,
+            list_split_points=list_split_points,
+            page_size=list_page_size,
+            bulk_delete=bulk_delete,
         )
     else:
         clean_up_bucket(
@@ -632,6 +1243,10 @@ def clean_bucket(
             namespace,
             delete_bucket=delete_bucket,
             num_workers=workers,
+            lifecycle_mode=lifecycle_mode,
+            list_split_points=list_split_points,
+            page_size=list_page_size,
+            bulk_delete=bulk_delete,
         )
 
 
@@ -645,32 +1260,46 @@ def clean_bucket(
     required=True,
     help="Compartment ID containing the log analytics entities",
 )
+@click.option(
+    "--namespace",
+    help="Object Storage namespace (looked up from the tenancy when omitted)",
+)
 @click.option(
     "--workers",
-    type=int,
-    default=1,
-    help="Number of worker threads for parallel processing",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help="Number of concurrent delete requests",
 )
-def clean_logs_analytics(oci_profile: str, compartment_id: str, workers: int):
+@click.option(
+    "--list-page-size",
+    type=click.IntRange(1, LIST_PAGE_SIZE),
+    default=LIST_PAGE_SIZE,
+    show_default=True,
+    help="Items requested per list call; run with --verbose to see what each page returned",
+)
+def clean_logs_analytics(
+        oci_profile: str,
+        compartment_id: str,
+        namespace: str,
+        workers: int,
+        list_page_size: int,
+):
     """Clean up OCI Log Analytics entities in a compartment"""
     # Initialize OCI clients
-    config = oci.config.from_file(profile_name=oci_profile)
-    log_analytics_client: LogAnalyticsClient = oci.log_analytics.LogAnalyticsClient(
-        config
-    )
-    object_storage_client: ObjectStorageClient = oci.object_storage.ObjectStorageClient(
-        config
-    )
+    # One socket per concurrent delete plus one for the background page fetch
+    log_analytics_client = get_log_analytics_client(oci_profile, workers + 1)
 
-    # Get namespace using Object Storage client
-    try:
-        namespace_response: Response = object_storage_client.get_namespace()
-        namespace: str = namespace_response.data
-    except Exception as e:
-        raise click.UsageError(f"Failed to get namespace: {e}")
+    # Get namespace using Object Storage client unless given
+    if not namespace:
+        object_storage_client = get_object_storage_client(oci_profile)
+        try:
+            namespace = get_namespace(object_storage_client)
+        except Exception as e:
+            raise click.UsageError(f"Failed to get namespace: {e}")
 
     clean_log_analytics_entities(
-        log_analytics_client, compartment_id, namespace, workers
+        log_analytics_client, compartment_id, namespace, workers, list_page_size
     )
 
 